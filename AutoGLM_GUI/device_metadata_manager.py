@@ -67,6 +67,8 @@ class DeviceMetadataManager:
         self.metadata_file = self.storage_dir / "metadata.json"
 
         self._metadata: dict[str, DeviceMetadata] = {}
+        # Read-through cache for get_display_name; only written under _data_lock
+        self._display_name_cache: dict[str, Optional[str]] = {}
         self._data_lock = threading.RLock()
 
         self._load_metadata()
@@ -88,14 +90,14 @@ class DeviceMetadataManager:
             return
 
         try:
-            with open(self.metadata_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(self.metadata_file.read_bytes())
 
             with self._data_lock:
                 self._metadata = {
                     serial: DeviceMetadata.from_dict(meta_dict)
                     for serial, meta_dict in data.items()
                 }
+                self._display_name_cache.clear()
 
             logger.info(f"Loaded metadata for {len(self._metadata)} device(s)")
         except Exception as e:
@@ -120,8 +122,11 @@ class DeviceMetadataManager:
                     serial: meta.to_dict() for serial, meta in self._metadata.items()
                 }
 
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Encode in one shot and hand the whole payload to a single write;
+            # json.dump would issue a write() per chunk
+            temp_path.write_text(
+                json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
 
             temp_path.replace(self.metadata_file)
 
@@ -134,9 +139,17 @@ class DeviceMetadataManager:
 
     def get_display_name(self, serial: str) -> Optional[str]:
         """Get device display name by serial."""
+        # Fast path: cached reads skip the lock entirely
+        try:
+            return self._display_name_cache[serial]
+        except KeyError:
+            pass
+
         with self._data_lock:
             metadata = self._metadata.get(serial)
-            return metadata.display_name if metadata else None
+            display_name = metadata.display_name if metadata else None
+            self._display_name_cache[serial] = display_name
+            return display_name
 
     def set_display_name(self, serial: str, display_name: Optional[str]) -> None:
         """Set device display name. Empty string will be treated as None."""
@@ -158,6 +171,7 @@ class DeviceMetadataManager:
 
             self._metadata[serial].display_name = normalized_name
             self._metadata[serial].last_updated = datetime.now()
+            self._display_name_cache.pop(serial, None)
 
             self._save_metadata()
 
@@ -60,6 +60,9 @@ class DeviceProtocol(Protocol):
     - MockDevice: Routes operations through a state machine for testing
     """
 
+    # Empty slots only so MockDevice's __slots__ can drop its instance __dict__
+    __slots__ = ()
+
     @property
     def device_id(self) -> str:
         """Unique device identifier."""
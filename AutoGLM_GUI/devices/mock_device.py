@@ -33,6 +33,8 @@ class MockDevice(DeviceProtocol):
         >>> device.tap(100, 200)  # State machine validates and transitions
     """
 
+    __slots__ = ("_device_id", "_handle_tap", "_state_machine")
+
     def __init__(self, device_id: str, state_machine: "StateMachine"):
         """
         Initialize mock device.
@@ -43,6 +45,8 @@ class MockDevice(DeviceProtocol):
         """
         self._device_id = device_id
         self._state_machine = state_machine
+        # Bound once: tap/double_tap/long_press all route here every step
+        self._handle_tap = state_machine.handle_tap
 
     @property
     def device_id(self) -> str:
@@ -72,19 +76,19 @@ class MockDevice(DeviceProtocol):
         The click_region in scenario.yaml is in pixel coordinates.
         """
         # Pass pixel coordinates directly to state machine (no conversion)
-        self._state_machine.handle_tap(x, y)
+        self._handle_tap(x, y)
 
     def double_tap(self, x: int, y: int, delay: float | None = None) -> None:
         """Handle double tap (treated as single tap)."""
         # Pass pixel coordinates directly to state machine (no conversion)
-        self._state_machine.handle_tap(x, y)
+        self._handle_tap(x, y)
 
     def long_press(
         self, x: int, y: int, duration_ms: int = 3000, delay: float | None = None
     ) -> None:
         """Handle long press (treated as tap for testing)."""
         # Pass pixel coordinates directly to state machine (no conversion)
-        self._state_machine.handle_tap(x, y)
+        self._handle_tap(x, y)
 
     def swipe(
         self,
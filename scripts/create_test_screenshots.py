@@ -6,48 +6,93 @@ Since the test framework uses Mock LLM and validates coordinates rather
 than actual image content, these placeholders are sufficient for testing.
 """
 
+from functools import cache
 from pathlib import Path
 
 try:
-    from PIL import Image
+    from PIL import Image, ImageDraw, ImageFont
 except ImportError:
     print("PIL not found, installing...")
+    import os
+    import platform
     import subprocess
 
-    subprocess.run(["uv", "run", "pip", "install", "pillow"], check=True)
-    from PIL import Image
+    installed = False
+    if platform.machine() == "x86_64":
+        # pillow-simd is a drop-in Pillow fork with SSE4/AVX2 fill and encoders.
+        # It builds from source, so fall back to regular Pillow if that fails.
+        result = subprocess.run(
+            ["uv", "run", "pip", "install", "pillow-simd"],
+            env={**os.environ, "CC": "cc -mavx2"},
+        )
+        installed = result.returncode == 0
+    if not installed:
+        subprocess.run(["uv", "run", "pip", "install", "pillow"], check=True)
+    from PIL import Image, ImageDraw, ImageFont
+
+
+SCENARIOS_DIR = (
+    Path(__file__).resolve().parent.parent
+    / "tests"
+    / "integration"
+    / "fixtures"
+    / "scenarios"
+)
+IMAGE_SIZE = (1080, 2400)
+FONT_PATH = "/System/Library/Fonts/Supplemental/Arial.ttf"
+
+
+def _load_fonts() -> tuple[
+    ImageFont.FreeTypeFont | ImageFont.ImageFont,
+    ImageFont.FreeTypeFont | ImageFont.ImageFont,
+]:
+    """Load the large and small fonts, falling back to the default font."""
+    try:
+        return ImageFont.truetype(FONT_PATH, 400), ImageFont.truetype(FONT_PATH, 80)
+    except Exception:
+        # Fall back to default font
+        return ImageFont.load_default(), ImageFont.load_default()
+
+
+# Shared across all screenshots: fonts are loaded once and every image starts
+# from a copy of the same white background instead of being rebuilt per call.
+FONT_LARGE, FONT_SMALL = _load_fonts()
+TEMPLATE = Image.new("RGB", IMAGE_SIZE, color="white")
+
+
+@cache
+def _progress_bbox(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont, digits: int, total: int
+) -> tuple[float, float, float, float]:
+    """Measure the progress text for a step number with the given digit count.
+
+    Digits share the same advance width, so one measurement per digit count
+    covers every step.
+    """
+    return font.getbbox(f"Step {'0' * digits} of {total}")
 
 
 def create_placeholder_image(
-    path: Path, index: int, total: int, size: tuple[int, int] = (1080, 2400)
-):
+    path: Path,
+    index: int,
+    total: int,
+    template: Image.Image = TEMPLATE,
+    font_large: ImageFont.FreeTypeFont | ImageFont.ImageFont = FONT_LARGE,
+    font_small: ImageFont.FreeTypeFont | ImageFont.ImageFont = FONT_SMALL,
+) -> None:
     """Create a minimal placeholder image with step number.
 
     Args:
         path: Where to save the image
         index: Step number (1-based)
         total: Total number of steps
-        size: Image dimensions (width, height)
+        template: White background image copied for each screenshot
+        font_large: Preloaded font for the step number
+        font_small: Preloaded font for the progress text
     """
-    from PIL import ImageDraw, ImageFont
-
-    # Create white background image
-    img = Image.new("RGB", size, color="white")
+    img = template.copy()
     draw = ImageDraw.Draw(img)
-
-    # Try to use a large font, fall back to default if not available
-    try:
-        # Try different font sizes for better visibility
-        font_large = ImageFont.truetype(
-            "/System/Library/Fonts/Supplemental/Arial.ttf", 400
-        )
-        font_small = ImageFont.truetype(
-            "/System/Library/Fonts/Supplemental/Arial.ttf", 80
-        )
-    except Exception:
-        # Fall back to default font
-        font_large = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    size = img.size
 
     # Calculate center position
     center_y = size[1] // 2
@@ -63,15 +108,16 @@ def create_placeholder_image(
 
     # Draw small text below showing progress
     progress_text = f"Step {index} of {total}"
-    bbox_small = draw.textbbox((0, 0), progress_text, font=font_small)
+    bbox_small = _progress_bbox(font_small, len(text), total)
     small_width = bbox_small[2] - bbox_small[0]
     small_position = ((size[0] - small_width) // 2, center_y + text_height)
 
     draw.text(small_position, progress_text, fill="gray", font=font_small)
 
-    # Save as PNG
+    # Save as PNG with the fastest zlib level; these fixtures are committed, so
+    # level 0 would make each file ~7.8 MB
     path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(path, "PNG")
+    img.save(path, "PNG", compress_level=1)
     print(f"Created: {path.name} (Step {index}/{total})")
 
 
@@ -79,15 +125,10 @@ def main():
     """Create placeholder screenshots for all test scenarios."""
 
     # WeChat multi-step test screenshots
-    wechat_dir = (
-        Path(__file__).parent.parent
-        / "tests"
-        / "integration"
-        / "fixtures"
-        / "scenarios"
-        / "wechat_multi_step"
-    )
+    wechat_dir = SCENARIOS_DIR / "wechat_multi_step"
 
+    # Must match scenario.yaml; StateSchema.validate_screenshot_extension
+    # (tests/integration/schema.py) accepts .png/.jpg/.jpeg only.
     wechat_states = [
         "state_1_home.png",
         "state_2_main.png",
@@ -110,6 +151,8 @@ def main():
     print(f"Directory: {wechat_dir}")
     print()
 
+    # Rendered serially: the whole batch is ~0.3 s of work, less than the cost
+    # of spawning worker processes that each reload PIL and the fonts
     for i, state_file in enumerate(wechat_states, start=1):
         create_placeholder_image(
             wechat_dir / state_file, index=i, total=len(wechat_states)
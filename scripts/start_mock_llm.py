@@ -76,7 +76,7 @@ def main():
 
 测试 API:
   http://localhost:18003/test/stats          # 获取请求统计
-  http://localhost:18003/test/reset          # 重置请求计数
+  http://localhost:18003/test/reset          # 重置请求计数和响应
   POST http://localhost:18003/test/set_responses  # 设置自定义响应
         """,
     )
@@ -134,7 +134,7 @@ def main():
     print("  POST /v1/chat/completions         # OpenAI 兼容聊天接口")
     print("\n测试 API:")
     print("  GET  /test/stats                  # 请求统计")
-    print("  POST /test/reset                  # 重置计数")
+    print("  POST /test/reset                  # 重置计数和响应")
     print("  POST /test/set_responses          # 设置响应")
     print("=" * 60)
     print("\n使用示例:")
@@ -9,8 +9,12 @@ from pathlib import Path
 import httpx
 import pytest
 
+_SCENARIOS_DIR = Path(__file__).resolve().parent / "fixtures" / "scenarios"
+_SAMPLE_TEST_CASE = _SCENARIOS_DIR / "meituan_message" / "scenario.yaml"
+_WECHAT_TEST_CASE = _SCENARIOS_DIR / "wechat_multi_step" / "scenario.yaml"
 
-def _run_autoglm_server(port: int, llm_url: str):
+
+def _run_autoglm_server(port: int, llm_url: str, home: str):
     """Run AutoGLM-GUI server in a subprocess."""
     import uvicorn
 
@@ -20,7 +24,9 @@ def _run_autoglm_server(port: int, llm_url: str):
     os.environ["AUTOGLM_BASE_URL"] = llm_url + "/v1"
     os.environ["AUTOGLM_MODEL_NAME"] = "mock-glm-model"
     os.environ["AUTOGLM_API_KEY"] = "mock-key"
-    os.environ["HOME"] = "/tmp"  # Override HOME to avoid loading user config
+    # Per-server HOME keeps ~/.config/autoglm (config, history, device metadata)
+    # away from the user's files and from servers started by other tests/workers
+    os.environ["HOME"] = home
 
     # Import and run the server
     from AutoGLM_GUI.server import app
@@ -28,28 +34,18 @@ def _run_autoglm_server(port: int, llm_url: str):
     uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
 
 
-def find_free_port(start: int = 18000, end: int = 19000) -> int:
-    """Find a free port in the specified range.
+def find_free_port() -> int:
+    """Ask the OS for a free ephemeral port.
 
-    Args:
-        start: Start of port range
-        end: End of port range (inclusive)
+    Binding to port 0 instead of scanning a fixed range keeps concurrently
+    running pytest-xdist workers from picking the same port.
 
     Returns:
         A free port number
-
-    Raises:
-        RuntimeError: If no free port is found
     """
-    for port in range(start, end + 1):
-        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
-            try:
-                sock.bind(("127.0.0.1", port))
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                return port
-            except OSError:
-                continue
-    raise RuntimeError(f"No free port found in range {start}-{end}")
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
 
 
 def wait_for_server(url: str, timeout: float = 5.0, endpoint: str = "/test/stats"):
@@ -78,19 +74,19 @@ def wait_for_server(url: str, timeout: float = 5.0, endpoint: str = "/test/stats
 @pytest.fixture
 def scenarios_dir() -> Path:
     """Get the test scenarios directory."""
-    return Path(__file__).parent / "fixtures" / "scenarios"
+    return _SCENARIOS_DIR
 
 
 @pytest.fixture
-def sample_test_case(scenarios_dir: Path) -> Path:
+def sample_test_case() -> Path:
     """Get the sample test case path (美团外卖测试)."""
-    return scenarios_dir / "meituan_message" / "scenario.yaml"
+    return _SAMPLE_TEST_CASE
 
 
 @pytest.fixture
-def wechat_test_case(scenarios_dir: Path) -> Path:
+def wechat_test_case() -> Path:
     """Get the WeChat multi-step test case path."""
-    return scenarios_dir / "wechat_multi_step" / "scenario.yaml"
+    return _WECHAT_TEST_CASE
 
 
 def _run_llm_server(port: int):
@@ -110,22 +106,14 @@ def _run_agent_server(port: int, scenario_path: str | None = None):
     uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
 
 
-@pytest.fixture
-def mock_llm_server():
-    """Start mock LLM server on a free port (function-scoped).
-
-    Returns:
-        Base URL of the mock LLM server (e.g., "http://127.0.0.1:18123")
+@pytest.fixture(scope="session")
+def _mock_llm_server_session():
+    """Start one mock LLM server per session (per worker under pytest-xdist).
 
-    Example:
-        def test_something(mock_llm_server: str):
-            model_config = ModelConfig(
-                base_url=mock_llm_server + "/v1",
-                api_key="mock-key",
-                model_name="mock-glm-model"
-            )
+    Server startup dominates a single scenario run, so the process is shared
+    and ``mock_llm_server`` resets its state before every test instead.
     """
-    port = find_free_port(start=18000, end=18999)
+    port = find_free_port()
     proc = multiprocessing.Process(target=_run_llm_server, args=(port,), daemon=True)
     proc.start()
 
@@ -141,6 +129,26 @@ def mock_llm_server():
         proc.join(timeout=1)
 
 
+@pytest.fixture
+def mock_llm_server(_mock_llm_server_session: str) -> str:
+    """Get the shared mock LLM server with request count and responses reset.
+
+    Returns:
+        Base URL of the mock LLM server (e.g., "http://127.0.0.1:18123")
+
+    Example:
+        def test_something(mock_llm_server: str):
+            model_config = ModelConfig(
+                base_url=mock_llm_server + "/v1",
+                api_key="mock-key",
+                model_name="mock-glm-model"
+            )
+    """
+    resp = httpx.post(f"{_mock_llm_server_session}/test/reset", timeout=5.0)
+    resp.raise_for_status()
+    return _mock_llm_server_session
+
+
 @pytest.fixture
 def mock_agent_server(request):
     """Start mock agent server on a free port (function-scoped).
@@ -164,7 +172,7 @@ def mock_agent_server(request):
     if hasattr(request, "param"):
         scenario_path = request.param
 
-    port = find_free_port(start=19000, end=19999)
+    port = find_free_port()
     proc = multiprocessing.Process(
         target=_run_agent_server, args=(port, scenario_path), daemon=True
     )
@@ -262,15 +270,16 @@ def _run_multi_agent_server(port: int):
 
 
 @pytest.fixture
-def local_server(mock_llm_server: str, mock_agent_server: str):
+def local_server(mock_llm_server: str, mock_agent_server: str, tmp_path_factory):
     """Start AutoGLM-GUI server locally (function-scoped for isolation).
 
-    Each test gets a fresh server instance on a unique port.
+    Each test gets a fresh server instance on a unique port, with its own
+    HOME directory so no ~/.config/autoglm state is shared between tests.
 
     Returns:
         Dict with server URLs and configuration
     """
-    port = find_free_port(start=8000, end=8099)
+    port = find_free_port()
     access_url = f"http://127.0.0.1:{port}"
     remote_url = mock_agent_server
     llm_url = mock_llm_server
@@ -279,9 +288,12 @@ def local_server(mock_llm_server: str, mock_agent_server: str):
     print(f"[Local E2E] Access URL: {access_url}")
     print(f"[Local E2E] LLM URL: {llm_url}")
 
-    # Start server in subprocess
-    proc = multiprocessing.Process(
-        target=_run_autoglm_server, args=(port, llm_url), daemon=True
+    # Start server in a spawned subprocess: a forked child would inherit
+    # AutoGLM_GUI modules already imported here, whose config paths were
+    # resolved from the real HOME at import time
+    home = tmp_path_factory.mktemp("autoglm_home")
+    proc = multiprocessing.get_context("spawn").Process(
+        target=_run_autoglm_server, args=(port, llm_url, str(home)), daemon=True
     )
     proc.start()
 
@@ -325,7 +337,7 @@ def mock_agent_server_multi():
             device1 = RemoteDevice("mock_device_001", mock_agent_server_multi)
             device2 = RemoteDevice("mock_device_002", mock_agent_server_multi)
     """
-    port = find_free_port(start=19000, end=19999)
+    port = find_free_port()
     proc = multiprocessing.Process(
         target=_run_multi_agent_server, args=(port,), daemon=True
     )
@@ -38,7 +38,7 @@ class MockLLMTestClient:
         return resp.json()
 
     def reset(self) -> dict:
-        """Reset request counter.
+        """Reset request counter and restore default responses.
 
         Returns:
             Dict with reset status
@@ -64,8 +64,9 @@ class MockLLMState:
         return self.responses[idx]
 
     def reset(self) -> None:
-        """Reset request count."""
+        """Reset request count and restore the default responses."""
         self.request_count = 0
+        self.responses = DEFAULT_RESPONSES.copy()
 
     def set_responses(self, responses: list[str]) -> None:
         """Override predefined responses."""
@@ -177,7 +178,7 @@ def _register_routes(app: FastAPI) -> None:
 
     @app.post("/test/reset")
     async def reset():
-        """Reset request counter."""
+        """Reset request counter and responses."""
         state.reset()
         return {"status": "reset", "request_count": 0}
 
@@ -1,14 +1,19 @@
 """Pydantic schemas for validating test case YAML configurations."""
 
-from pathlib import Path
+from collections import Counter
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, NonNegativeInt, field_validator
+
+_VALID_SCREENSHOT_EXTS = (".png", ".jpg", ".jpeg")
 
 
 class TransitionSchema(BaseModel):
     """Schema for state transition definition."""
 
-    click_region: tuple[int, int, int, int] = Field(
+    # Arity and non-negativity are enforced by the core schema
+    click_region: tuple[
+        NonNegativeInt, NonNegativeInt, NonNegativeInt, NonNegativeInt
+    ] = Field(
         description="Click region as (x1, y1, x2, y2) in pixels. "
         "Should include any desired tolerance in the boundary."
     )
@@ -20,21 +25,13 @@ class TransitionSchema(BaseModel):
     def validate_click_region(
         cls, v: tuple[int, int, int, int]
     ) -> tuple[int, int, int, int]:
-        """Validate click region coordinates."""
-        if len(v) != 4:
-            raise ValueError("click_region must have exactly 4 values (x1, y1, x2, y2)")
-
+        """Validate click region coordinates are ordered."""
         x1, y1, x2, y2 = v
-
-        if x1 < 0 or y1 < 0:
-            raise ValueError("Coordinates must be non-negative")
-
-        if x2 <= x1:
-            raise ValueError(f"x2 ({x2}) must be greater than x1 ({x1})")
-
-        if y2 <= y1:
-            raise ValueError(f"y2 ({y2}) must be greater than y1 ({y1})")
-
+        if x2 <= x1 or y2 <= y1:
+            raise ValueError(
+                f"Invalid click_region {v}: x2 must be greater than x1 "
+                "and y2 must be greater than y1"
+            )
         return v
 
 
@@ -62,11 +59,14 @@ class StateSchema(BaseModel):
     @classmethod
     def validate_screenshot_extension(cls, v: str) -> str:
         """Validate screenshot has valid image extension."""
-        valid_extensions = {".png", ".jpg", ".jpeg"}
-        ext = Path(v).suffix.lower()
-        if ext not in valid_extensions:
+        # Require a non-empty stem: a bare ".png" has no suffix, as with Path
+        name = v.rpartition("/")[2].lower()
+        if not any(
+            name.endswith(ext) and len(name) > len(ext)
+            for ext in _VALID_SCREENSHOT_EXTS
+        ):
             raise ValueError(
-                f"Screenshot must have one of {valid_extensions}, got: {ext}"
+                f"Screenshot must have one of {_VALID_SCREENSHOT_EXTS}, got: {v}"
             )
         return v
 
@@ -101,13 +101,13 @@ class TestScenarioSchema(BaseModel):
             raise ValueError("Must define at least one state")
 
         # Check for duplicate state IDs
-        state_ids = [state.id for state in v]
-        duplicates = [sid for sid in state_ids if state_ids.count(sid) > 1]
+        id_counts = Counter(state.id for state in v)
+        duplicates = [sid for sid, count in id_counts.items() if count > 1]
         if duplicates:
             raise ValueError(f"Duplicate state IDs found: {set(duplicates)}")
 
         # Validate that all next_state references exist
-        valid_ids = set(state_ids)
+        valid_ids = id_counts.keys()
         for state in v:
             for transition in state.transitions:
                 if transition.next_state not in valid_ids:
@@ -117,8 +117,7 @@ class TestScenarioSchema(BaseModel):
                     )
 
         # Check that there's at least one terminal state
-        terminal_states = [s for s in v if s.is_terminal]
-        if not terminal_states:
+        if not any(s.is_terminal for s in v):
             raise ValueError("Must have at least one terminal state (is_terminal=true)")
 
         return v
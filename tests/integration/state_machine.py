@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from tests.integration.schema import TestScenarioSchema
+
 
 @dataclass
 class Transition:
@@ -261,7 +263,6 @@ def load_test_case(
         ValueError: If YAML validation fails
     """
     import yaml
-    from tests.integration.schema import TestScenarioSchema
 
     yaml_path = Path(yaml_path)
     base_dir = Path(base_dir) if base_dir else yaml_path.parent
@@ -6,21 +6,10 @@ import pytest
 
 from tests.integration.test_runner import TestRunner
 
-
-class TestAgentIntegration:
-    """Test Agent integration using state machine."""
-
-    def test_sample_case(
-        self, sample_test_case: Path, mock_llm_server: str, mock_llm_client
-    ):
-        """Test the sample test case (美团外卖消息按钮)."""
-        from AutoGLM_GUI.config import ModelConfig
-
-        # Configure Mock LLM with correct coordinates for normalized click_region
-        mock_llm_client.set_responses(
-            [
-                # Response A: First request (find and tap message button)
-                """用户要求点击屏幕下方的消息按钮。我需要查看当前截图，找到消息按钮的位置。
+# Mock LLM responses with correct coordinates for normalized click_region
+MEITUAN_MESSAGE_RESPONSES = [
+    # Response A: First request (find and tap message button)
+    """用户要求点击屏幕下方的消息按钮。我需要查看当前截图，找到消息按钮的位置。
 
 从截图中可以看到，这是美团app的主界面。在底部导航���中，我可以看到几个选项：
 - 推荐（黄色高亮）
@@ -33,8 +22,8 @@ class TestAgentIntegration:
 
 我需要点击这个消息按钮。根据截图，消息按钮的位置大约在底部导航栏的中间位置，坐标大约是(499, 966)左右。
 do(action="Tap", element=[499,966])""",
-                # Response B: Second request (finish with success message)
-                """好的，我成功点击了消息按钮，现在进入了消息页面。页面显示了各种消息类型，包括：
+    # Response B: Second request (finish with success message)
+    """好的，我成功点击了消息按钮，现在进入了消息页面。页面显示了各种消息类型，包括：
 - 订单动态
 - 服务提醒（有2条未读）
 - 粉丝福利
@@ -46,8 +35,34 @@ do(action="Tap", element=[499,966])""",
 
 任务已经完成，我成功点击了屏幕下方的消息按钮，现在进入了消息页面。
 finish(message="已成功点击消息按钮！现在进入了消息页面，可以看到各类消息通知，包括订单动态、服务提醒（有2条未读）、美团会员、美团客服以及2周前的历史消息。")""",
-            ]
-        )
+]
+
+# (scenario directory, mock LLM responses, expected final state). Scenarios are
+# independent, so pytest-xdist can spread them across workers.
+SCENARIO_CASES = [
+    pytest.param(
+        "meituan_message", MEITUAN_MESSAGE_RESPONSES, "message", id="meituan_message"
+    ),
+]
+
+
+class TestAgentIntegration:
+    """Test Agent integration using state machine."""
+
+    @pytest.mark.parametrize(("scenario", "responses", "final_state"), SCENARIO_CASES)
+    def test_sample_case(
+        self,
+        scenarios_dir: Path,
+        scenario: str,
+        responses: list[str],
+        final_state: str,
+        mock_llm_server: str,
+        mock_llm_client,
+    ):
+        """Run a scenario end to end (e.g. 美团外卖消息按钮)."""
+        from AutoGLM_GUI.config import ModelConfig
+
+        mock_llm_client.set_responses(responses)
 
         # Use mock LLM config
         model_config = ModelConfig(
@@ -56,11 +71,11 @@ finish(message="已成功点击消息按钮！现在进入了消息页面，可
             model_name="mock-glm-model",
         )
 
-        runner = TestRunner(sample_test_case)
+        runner = TestRunner(scenarios_dir / scenario / "scenario.yaml")
         result = runner.run(model_config=model_config)
 
         assert result["passed"], f"Test failed: {result['failure_reason']}"
-        assert result["final_state"] == "message"
+        assert result["final_state"] == final_state
 
     def test_state_machine_loading(self, sample_test_case: Path):
         """Test that test case loads correctly."""
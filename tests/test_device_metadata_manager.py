@@ -1,7 +1,6 @@
 """Unit tests for DeviceMetadataManager."""
 
 import json
-import tempfile
 import pytest
 from pathlib import Path
 
@@ -15,18 +14,17 @@ class TestDeviceMetadataManager:
     """Test DeviceMetadataManager singleton functionality."""
 
     @pytest.fixture
-    def manager(self):
+    def manager(self, tmp_path: Path):
         """Create a fresh DeviceMetadataManager instance for each test."""
         # Reset singleton to ensure clean state
         DeviceMetadataManager._instance = None
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Set custom metadata path for testing
-            manager = DeviceMetadataManager.get_instance(storage_dir=Path(temp_dir))
-            yield manager
+        # Set custom metadata path for testing
+        manager = DeviceMetadataManager.get_instance(storage_dir=tmp_path)
+        yield manager
 
-            # Cleanup
-            DeviceMetadataManager._instance = None
+        # Cleanup
+        DeviceMetadataManager._instance = None
 
     def test_singleton_returns_same_instance(self):
         """Test that get_instance returns the same instance."""
@@ -137,7 +135,7 @@ class TestDeviceMetadataManager:
         assert all_metadata["dev2"].display_name == "Device 2"
         assert all_metadata["dev3"].display_name == "Device 3"
 
-    def test_corrupted_json_creates_backup(self, manager):
+    def test_corrupted_json_creates_backup(self, manager, tmp_path: Path):
         """Test that corrupted JSON is backed up and recovered."""
         serial = "corruption_test_1"
         name = "Original Name"
@@ -172,18 +170,15 @@ class TestDeviceMetadataManager:
         assert manager2.get_metadata(serial) is None
 
         DeviceMetadataManager._instance = None
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager2 = DeviceMetadataManager.get_instance(storage_dir=Path(temp_dir))
+        manager2 = DeviceMetadataManager.get_instance(storage_dir=tmp_path / "other")
 
-            # Verify backup file was created
-            assert backup_file.exists(), (
-                "Backup file should be created for corrupted JSON"
-            )
+        # Verify backup file was created
+        assert backup_file.exists(), "Backup file should be created for corrupted JSON"
 
-            # Metadata should be empty (corrupt file renamed to .bak)
-            assert manager2.get_metadata(serial) is None
+        # Metadata should be empty (corrupt file renamed to .bak)
+        assert manager2.get_metadata(serial) is None
 
-            DeviceMetadataManager._instance = None
+        DeviceMetadataManager._instance = None
 
     def test_set_display_name_idempotent(self, manager):
         """Test that setting same value multiple times is idempotent."""
@@ -200,59 +195,54 @@ class TestDeviceMetadataManager:
 
     def test_thread_safety_with_rlock(self, manager):
         """Test that multiple operations are thread-safe (basic check)."""
-        import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         serial = "thread_safety_test"
-        results = []
 
         def set_name():
             manager.set_display_name(serial, "Thread Test")
 
         def get_name():
-            results.append(manager.get_display_name(serial))
+            return manager.get_display_name(serial)
 
-        # Run multiple threads
-        threads = [
-            threading.Thread(target=set_name),
-            threading.Thread(target=get_name),
-            threading.Thread(target=set_name),
-            threading.Thread(target=get_name),
-        ]
+        # Run operations concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            set_futures = [executor.submit(set_name) for _ in range(2)]
+            get_futures = [executor.submit(get_name) for _ in range(2)]
 
-        for t in threads:
-            t.start()
+            for future in as_completed(set_futures + get_futures, timeout=5):
+                future.result()
 
-        for t in threads:
-            t.join(timeout=5)
+        results = [future.result() for future in get_futures]
 
         # All operations should complete without error
         assert len(results) > 0
 
-    def test_list_all_metadata_returns_empty_dict_when_no_devices(self, manager):
+    def test_list_all_metadata_returns_empty_dict_when_no_devices(
+        self, manager, tmp_path: Path
+    ):
         """Test that list_all_metadata returns empty dict initially."""
         DeviceMetadataManager._instance = None
-        with tempfile.TemporaryDirectory() as temp_dir:
-            fresh_manager = DeviceMetadataManager.get_instance(
-                storage_dir=Path(temp_dir)
-            )
+        fresh_manager = DeviceMetadataManager.get_instance(
+            storage_dir=tmp_path / "fresh"
+        )
 
-            all_metadata = fresh_manager.list_all_metadata()
+        all_metadata = fresh_manager.list_all_metadata()
 
-            assert all_metadata == {}
+        assert all_metadata == {}
 
-            DeviceMetadataManager._instance = None
+        DeviceMetadataManager._instance = None
 
 
 class TestDeviceMetadataManagerValidation:
     """Test DeviceMetadataManager validation logic."""
 
     @pytest.fixture
-    def manager(self):
+    def manager(self, tmp_path: Path):
+        DeviceMetadataManager._instance = None
+        manager = DeviceMetadataManager.get_instance(storage_dir=tmp_path)
+        yield manager
         DeviceMetadataManager._instance = None
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager = DeviceMetadataManager.get_instance(storage_dir=Path(temp_dir))
-            yield manager
-            DeviceMetadataManager._instance = None
 
     def test_display_name_max_length_constant(self):
         """Test that DISPLAY_NAME_MAX_LENGTH is 100."""
@@ -272,7 +262,9 @@ class TestDeviceMetadataManagerValidation:
 
         assert isinstance(metadata.last_updated, datetime.datetime)
 
-    def test_from_dict_missing_last_updated_uses_current_time(self, manager):
+    def test_from_dict_missing_last_updated_uses_current_time(
+        self, manager, tmp_path: Path
+    ):
         """Test that missing last_updated uses current time."""
         serial = "last_updated_test"
 
@@ -294,33 +286,30 @@ class TestDeviceMetadataManagerValidation:
         assert isinstance(metadata.last_updated, datetime.datetime)
 
         DeviceMetadataManager._instance = None
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manager2 = DeviceMetadataManager.get_instance(storage_dir=Path(temp_dir))
+        manager2 = DeviceMetadataManager.get_instance(storage_dir=tmp_path / "other")
 
-            # Metadata should be empty (corrupt file renamed to .bak)
-            assert manager2.get_metadata(serial) is None
+        # Metadata should be empty (corrupt file renamed to .bak)
+        assert manager2.get_metadata(serial) is None
 
-            DeviceMetadataManager._instance = None
+        DeviceMetadataManager._instance = None
 
     def test_from_dict_invalid_json_structure_ignores_device(self, manager):
         """Test that malformed JSON file triggers backup and reset (fail-safe behavior)."""
         serial1 = "valid_device"
         serial2 = "invalid_device"
 
-        # Set one valid device
-        manager.set_display_name(serial1, "Valid Name")
-
-        # Add malformed entry manually
+        # Write one valid device and one malformed entry directly
         metadata_file = manager.metadata_file
         backup_file = metadata_file.with_suffix(".json.bak")
 
-        with open(metadata_file, "r") as f:
-            data = json.load(f)
-
-        data[serial2] = "this is not a dict"
-
-        with open(metadata_file, "w") as f:
-            json.dump(data, f)
+        metadata_file.write_text(
+            json.dumps(
+                {
+                    serial1: {"serial": serial1, "display_name": "Valid Name"},
+                    serial2: "this is not a dict",
+                }
+            )
+        )
 
         # Reload manager from same storage
         DeviceMetadataManager._instance = None
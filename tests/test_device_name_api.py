@@ -1,9 +1,12 @@
 """Integration tests for device name API endpoints."""
 
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
 from AutoGLM_GUI.api import create_app
+from AutoGLM_GUI.device_manager import DeviceManager
 from AutoGLM_GUI.device_metadata_manager import (
     DISPLAY_NAME_MAX_LENGTH,
     DeviceMetadataManager,
@@ -18,9 +21,15 @@ def client():
 
 
 @pytest.fixture(autouse=True)
-def reset_manager():
-    """Reset DeviceMetadataManager singleton before each test."""
+def reset_manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Back each test with a fresh DeviceMetadataManager in tmp_path.
+
+    DeviceManager keeps the metadata manager it was created with, so point it
+    at the per-test instance instead of the real ~/.config/autoglm storage.
+    """
     DeviceMetadataManager._instance = None
+    manager = DeviceMetadataManager.get_instance(storage_dir=tmp_path)
+    monkeypatch.setattr(DeviceManager.get_instance(), "_metadata_manager", manager)
     yield
     DeviceMetadataManager._instance = None
 